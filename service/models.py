@@ -175,6 +175,18 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of Products")
+        return db.session.query(db.func.count(cls.id)).scalar()
+
+    @classmethod
+    def is_empty(cls) -> bool:
+        """Returns True if there are no Products in the database"""
+        logger.info("Processing check for any Products")
+        return db.session.query(cls.id).first() is None
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
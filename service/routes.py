@@ -136,7 +136,7 @@ def get_products(product_id):
     Reads a Product
     This endpoint will read a Product based on its ID
     """
-    app.logger.info(f"Request to Read a Product with ID {product_id}")
+    app.logger.info("Request to Read a Product with ID %s", product_id)
 
     # Call the Product.find() method which will return a product with the given product_id
     product = Product.find(product_id)
@@ -0,0 +1,10 @@
+"""
+Test package
+
+Defaults DATABASE_URI to an in-memory SQLite database. This has to happen
+before anything imports service, because the service initializes its
+database from service.config at import time.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")